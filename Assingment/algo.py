@@ -1,5 +1,3 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 from collections import deque
 import heapq
 
@@ -83,6 +81,10 @@ def ucs(start, goal):
     return None, float('inf')
 
 def draw_graph():
+    # Plotting libraries are slow to import, so only load them when drawing
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     G = nx.Graph()
     for u, v, w in edges:
         G.add_edge(u, v, weight=w)
@@ -121,45 +123,75 @@ def print_path(path, cost=None):
         if cost is not None:
             print(f"Total Distance: {cost} meters")
 
-def main():
-    print("Campus Pathfinding (Based on Map Diagram)")
-    print("\nAvailable Locations:")
-    for location in graph:
-        print("-", location)
-
-    start = input("\nEnter START location: ").strip()
-    goal = input("Enter GOAL location: ").strip()
+ALGORITHMS = {"1": "BFS", "2": "DFS", "3": "UCS"}
+
+def find_path(start, goal, algorithm):
+    # Headless entry point: returns (path, cost), cost is None for BFS/DFS
+    algorithm = ALGORITHMS.get(algorithm, algorithm).upper()
+    if algorithm == "BFS":
+        return bfs(start, goal), None
+    elif algorithm == "DFS":
+        return dfs(start, goal), None
+    elif algorithm == "UCS":
+        return ucs(start, goal)
+    raise ValueError("Unknown algorithm: %s" % algorithm)
+
+def parse_args(argv=None):
+    # Imported here so that importing algo stays cheap
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Campus Pathfinding (Based on Map Diagram)")
+    parser.add_argument("--start", help="START location (runs without prompts)")
+    parser.add_argument("--goal", help="GOAL location (runs without prompts)")
+    parser.add_argument("--algo", default="UCS", help="BFS, DFS or UCS (default: UCS)")
+    parser.add_argument("--plot", action=argparse.BooleanOptionalAction, default=None,
+                        help="draw the campus map (default: only in interactive mode)")
+    args = parser.parse_args(argv)
+    if (args.start is None) != (args.goal is None):
+        parser.error("--start and --goal must be given together")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    interactive = args.start is None or args.goal is None
+    plot = interactive if args.plot is None else args.plot
+
+    if interactive:
+        print("Campus Pathfinding (Based on Map Diagram)")
+        print("\nAvailable Locations:")
+        for location in graph:
+            print("-", location)
+
+        start = input("\nEnter START location: ").strip()
+        goal = input("Enter GOAL location: ").strip()
+    else:
+        start, goal = args.start, args.goal
 
     if start not in graph or goal not in graph:
         print("Invalid location(s).")
         return
 
-    print("\nChoose algorithm:")
-    print("1. BFS")
-    print("2. DFS")
-    print("3. UCS")
-    choice = input("Enter choice (1/2/3): ").strip()
-
-    print("\nFinding path...\n")
-
-    if choice == "1":
-        path = bfs(start, goal)
-        print("BFS Result:")
-        print_path(path)
-    elif choice == "2":
-        path = dfs(start, goal)
-        print("DFS Result:")
-        print_path(path)
-    elif choice == "3":
-        path, cost = ucs(start, goal)
-        print("UCS Result:")
+    if interactive:
+        print("\nChoose algorithm:")
+        print("1. BFS")
+        print("2. DFS")
+        print("3. UCS")
+        choice = input("Enter choice (1/2/3): ").strip()
+        print("\nFinding path...\n")
+    else:
+        choice = args.algo
+
+    algorithm = ALGORITHMS.get(choice, choice).upper()
+    if algorithm in ALGORITHMS.values():
+        path, cost = find_path(start, goal, algorithm)
+        print(algorithm + " Result:")
         print_path(path, cost)
     else:
         print("Invalid choice.")
 
     # Visualize the graph
-    draw_graph()
+    if plot:
+        draw_graph()
 
 if __name__ == "__main__":
     main()
-
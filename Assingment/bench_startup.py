@@ -0,0 +1,57 @@
+import argparse
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# ---------- Import-time Benchmark ----------
+# Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+# adds up the cumulative time of the top-level imports it reports.
+def import_time(module, repeat=5):
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module],
+            cwd=HERE, capture_output=True, text=True, check=True)
+        times = parse_importtime(result.stderr)
+        if best is None or times[module] < best[module]:
+            best = times
+    return best
+
+def parse_importtime(output):
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            name = name.strip()
+            times[name] = times.get(name, 0) + int(cumulative)
+    return times
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup import-time benchmark for algo.py")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per module (best is kept)")
+    parser.add_argument("--max-ms", type=float, help="fail if importing algo takes longer")
+    args = parser.parse_args(argv)
+
+    algo_ms = None
+    for module in ("algo", "networkx", "matplotlib.pyplot"):
+        try:
+            times = import_time(module, args.repeat)
+        except subprocess.CalledProcessError:
+            print("%-20s not installed" % module)
+            continue
+        print("%-20s %8.1f ms" % (module, times[module] / 1000))
+        if module == "algo":
+            algo_ms = times[module] / 1000
+
+    if args.max_ms is not None and algo_ms is not None and algo_ms > args.max_ms:
+        print("algo import took %.1f ms (limit %.1f ms)" % (algo_ms, args.max_ms))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
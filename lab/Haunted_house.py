@@ -79,6 +79,25 @@ def reconstruct_path(came_from, start, goal):
     path.reverse()
     return path
 
+def parse_grid(original_grid):
+    # Turn a map with 'S'/'G' markers into a 0/1 grid plus start and goal
+    grid = []
+    start = goal = None
+    for i in range(len(original_grid)):
+        row = []
+        for j in range(len(original_grid[0])):
+            cell = original_grid[i][j]
+            if cell == 'S':
+                start = (i, j)
+                row.append(0)
+            elif cell == 'G':
+                goal = (i, j)
+                row.append(0)
+            else:
+                row.append(int(cell))
+        grid.append(row)
+    return grid, start, goal
+
 
 # ---------- Main ----------
 original_grid = [
@@ -90,28 +109,15 @@ original_grid = [
     [0, 1, 0, 0, 0, 0]
 ]
 
-grid = []
-start = goal = None
-for i in range(len(original_grid)):
-    row = []
-    for j in range(len(original_grid[0])):
-        cell = original_grid[i][j]
-        if cell == 'S':
-            start = (i, j)
-            row.append(0)
-        elif cell == 'G':
-            goal = (i, j)
-            row.append(0)
-        else:
-            row.append(int(cell))
-    grid.append(row)
-
 # --- Run Algorithms ---
-gbfs_path = greedy_best_first(start, goal, grid, manhattan)
-astar_man = a_star(start, goal, grid, manhattan)
-astar_euc = a_star(start, goal, grid, euclidean)
-
-# --- Output Final Paths Only ---
-print("Greedy BFS (Manhattan):", gbfs_path)
-print("A* (Manhattan):", astar_man)
-print("A* (Euclidean):", astar_euc)
+if __name__ == "__main__":
+    grid, start, goal = parse_grid(original_grid)
+
+    gbfs_path = greedy_best_first(start, goal, grid, manhattan)
+    astar_man = a_star(start, goal, grid, manhattan)
+    astar_euc = a_star(start, goal, grid, euclidean)
+
+    # --- Output Final Paths Only ---
+    print("Greedy BFS (Manhattan):", gbfs_path)
+    print("A* (Manhattan):", astar_man)
+    print("A* (Euclidean):", astar_euc)
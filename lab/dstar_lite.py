@@ -0,0 +1,174 @@
+import heapq
+import random
+
+from Haunted_house import (a_star, euclidean, manhattan, neighbors,
+                           original_grid, parse_grid)
+
+INF = float('inf')
+
+
+# ---------- D* Lite (incremental replanning) ----------
+# Searches backwards from the goal and keeps g/rhs values between calls, so
+# when a cell flips between 0 and 1 only the affected part is repaired
+# instead of running a_star again from scratch.
+# Moving into a cell costs 1 unless it is a wall (same rule as a_star).
+class DStarLite:
+    def __init__(self, start, goal, grid, heuristic=manhattan):
+        self.grid = [list(row) for row in grid]
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.km = 0
+        self.last = start
+        self.g = {}
+        self.rhs = {goal: 0}
+        self.open_list = []
+        self.open_keys = {}
+        self.push(goal)
+        self.compute_shortest_path()
+
+    # --- Search state ---
+    def calculate_key(self, s):
+        m = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (m + self.heuristic(self.start, s) + self.km, m)
+
+    def push(self, s):
+        key = self.calculate_key(s)
+        self.open_keys[s] = key
+        heapq.heappush(self.open_list, (key, s))
+
+    def top_key(self):
+        # Drop entries that were re-pushed or removed since being added
+        while self.open_list:
+            key, s = self.open_list[0]
+            if self.open_keys.get(s) == key:
+                return key
+            heapq.heappop(self.open_list)
+        return (INF, INF)
+
+    def cost(self, v):
+        return INF if self.grid[v[0]][v[1]] == 1 else 1
+
+    def update_vertex(self, u):
+        if u != self.goal:
+            best = INF
+            for v in neighbors(u, self.rows, self.cols):
+                best = min(best, self.cost(v) + self.g.get(v, INF))
+            self.rhs[u] = best
+        if self.g.get(u, INF) != self.rhs.get(u, INF):
+            self.push(u)
+        else:
+            self.open_keys.pop(u, None)
+
+    def compute_shortest_path(self):
+        while (self.top_key() < self.calculate_key(self.start)
+               or self.rhs.get(self.start, INF) != self.g.get(self.start, INF)):
+            k_old, u = heapq.heappop(self.open_list)
+            k_new = self.calculate_key(u)
+            if k_old < k_new:
+                self.push(u)
+            elif self.g.get(u, INF) > self.rhs.get(u, INF):
+                self.g[u] = self.rhs[u]
+                del self.open_keys[u]
+                for p in neighbors(u, self.rows, self.cols):
+                    self.update_vertex(p)
+            else:
+                self.g[u] = INF
+                self.update_vertex(u)
+                for p in neighbors(u, self.rows, self.cols):
+                    self.update_vertex(p)
+
+    # --- Events ---
+    def update_cell(self, cell, value):
+        self.update_cells([(cell, value)])
+
+    def update_cells(self, changes):
+        # changes: list of ((x, y), 0 or 1) events, e.g. a door closing
+        for (x, y), value in changes:
+            if self.grid[x][y] == value:
+                continue
+            self.grid[x][y] = value
+            # Only edges entering (x, y) change cost
+            for p in neighbors((x, y), self.rows, self.cols):
+                self.update_vertex(p)
+        self.compute_shortest_path()
+
+    def move_start(self, new_start):
+        # Keys already in the open list were computed for the old start;
+        # km keeps them lower bounds for the new one
+        self.km += self.heuristic(self.last, new_start)
+        self.last = new_start
+        self.start = new_start
+        self.compute_shortest_path()
+
+    # --- Results ---
+    def path_cost(self):
+        return self.g.get(self.start, INF)
+
+    def path(self):
+        cost = self.path_cost()
+        if cost == INF:
+            return None
+        path = [self.start]
+        cur = self.start
+        # A consistent state reaches the goal in exactly `cost` steps
+        for _ in range(int(cost)):
+            cur = min(neighbors(cur, self.rows, self.cols),
+                      key=lambda v: self.cost(v) + self.g.get(v, INF))
+            path.append(cur)
+            if cur == self.goal:
+                break
+        if cur != self.goal:
+            return None
+        return path
+
+
+# ---------- Check ----------
+def check_against_a_star(trials=200, steps=30, seed=0):
+    # Random cell updates and start moves; path_cost() must always match a
+    # fresh a_star run
+    rng = random.Random(seed)
+    for _ in range(trials):
+        rows, cols = rng.randint(3, 25), rng.randint(3, 25)
+        grid = [[1 if rng.random() < 0.3 else 0 for _ in range(cols)] for _ in range(rows)]
+        start = (rng.randrange(rows), rng.randrange(cols))
+        goal = (rng.randrange(rows), rng.randrange(cols))
+        grid[start[0]][start[1]] = 0
+        heuristic = rng.choice([manhattan, euclidean])
+        planner = DStarLite(start, goal, grid, heuristic)
+        for _ in range(steps):
+            expected = a_star(planner.start, goal, planner.grid, heuristic)
+            expected_cost = INF if expected is None else len(expected) - 1
+            assert planner.path_cost() == expected_cost, (planner.start, goal)
+            path = planner.path()
+            assert (path is None) == (expected is None)
+            if path is not None:
+                assert len(path) - 1 == expected_cost
+
+            if rng.random() < 0.3:
+                free = [(x, y) for x in range(rows) for y in range(cols)
+                        if planner.grid[x][y] == 0]
+                planner.move_start(rng.choice(free))
+            cell = (rng.randrange(rows), rng.randrange(cols))
+            if cell != planner.start:
+                planner.update_cell(cell, 1 - planner.grid[cell[0]][cell[1]])
+    print("D* Lite matches a_star on %d random grids" % trials)
+
+
+# ---------- Main ----------
+if __name__ == "__main__":
+    grid, start, goal = parse_grid(original_grid)
+
+    planner = DStarLite(start, goal, grid)
+    print("D* Lite:", planner.path())
+
+    # A ghost appears in the corridor
+    planner.update_cell((3, 4), 1)
+    print("D* Lite (ghost at (3, 4)):", planner.path())
+
+    # The ghost leaves again
+    planner.update_cell((3, 4), 0)
+    print("D* Lite (ghost gone):", planner.path())
+
+    check_against_a_star()
@@ -0,0 +1,134 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from Haunted_house import a_star, manhattan, original_grid, parse_grid
+
+# ---------- Binary Map Format ----------
+# A 32 byte header followed by one uint8 per cell (0 = free, 1 = wall),
+# row by row:
+#   magic (8 bytes), rows, cols (uint32), start x, y, goal x, y (int32, -1 if unset)
+# Cells stay one byte each (not bit-packed) so grid[x][y] is a plain index.
+MAGIC = b"HHMAP\x00\x01\x00"
+HEADER = struct.Struct("<8sIIiiii")
+
+
+class MappedGrid:
+    # View over a memory-mapped map file (read-only unless writable=True).
+    # Opening costs the same for any map size: rows are slices of the mapping,
+    # so search functions can use it like the list-of-lists grid
+    # (len(grid), grid[x][y]). Each row view is made on first use and then
+    # reused, which keeps grid[x][y] about as fast as on a list grid.
+    # close() releases those views; it raises BufferError while the caller
+    # still holds slices of its own made from a row.
+    def __init__(self, path, writable=False):
+        with open(path, "r+b" if writable else "rb") as f:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self.buffer = mmap.mmap(f.fileno(), 0, access=access)
+        if len(self.buffer) < HEADER.size:
+            self.buffer.close()
+            raise ValueError("%s is not a Haunted_house map file" % path)
+        magic, self.rows, self.cols, sx, sy, gx, gy = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            self.buffer.close()
+            raise ValueError("%s is not a Haunted_house map file" % path)
+        if len(self.buffer) < HEADER.size + self.rows * self.cols:
+            self.buffer.close()
+            raise ValueError("%s is truncated" % path)
+        self.start = (sx, sy) if sx >= 0 else None
+        self.goal = (gx, gy) if gx >= 0 else None
+        self.cells = memoryview(self.buffer)[HEADER.size:HEADER.size + self.rows * self.cols]
+        self.row_views = [None] * self.rows
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, x):
+        row = self.row_views[x]
+        if row is None:
+            if x < 0:
+                x += self.rows
+            row = self.row_views[x] = self.cells[x * self.cols:(x + 1) * self.cols]
+        return row
+
+    def close(self):
+        for row in self.row_views:
+            if row is not None:
+                row.release()
+        self.row_views = []
+        self.cells.release()
+        self.buffer.close()
+
+
+def load_map(path, writable=False):
+    grid = MappedGrid(path, writable)
+    return grid, grid.start, grid.goal
+
+def check_rows(grid):
+    # Every row must be as wide as the first; parse_grid and the file
+    # format both read the width from row 0 only
+    if not len(grid):
+        raise ValueError("Map is empty")
+    cols = len(grid[0])
+    for i, row in enumerate(grid):
+        if len(row) != cols:
+            raise ValueError("Map row %d has %d cells, expected %d" % (i, len(row), cols))
+
+def save_map(path, grid, start=None, goal=None):
+    check_rows(grid)
+    rows, cols = len(grid), len(grid[0])
+    sx, sy = start if start is not None else (-1, -1)
+    gx, gy = goal if goal is not None else (-1, -1)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, rows, cols, sx, sy, gx, gy))
+        for row in grid:
+            f.write(bytes(row))
+
+
+# ---------- Converters ----------
+def parse_text(text):
+    # Text-art maps: '#' or '1' is a wall, '.' or '0' is free, 'S'/'G' mark
+    # start and goal. Spaces between cells are ignored.
+    original = []
+    for line in text.splitlines():
+        line = line.replace(" ", "")
+        if not line:
+            continue
+        row = []
+        for ch in line:
+            if ch in "SG":
+                row.append(ch)
+            elif ch in "#1":
+                row.append(1)
+            elif ch in ".0":
+                row.append(0)
+            else:
+                raise ValueError("Unknown map character: %r" % ch)
+        original.append(row)
+    check_rows(original)
+    return parse_grid(original)
+
+def convert_list(original, path):
+    check_rows(original)
+    save_map(path, *parse_grid(original))
+
+def convert_text(text_path, path):
+    with open(text_path) as f:
+        save_map(path, *parse_text(f.read()))
+
+
+# ---------- Main ----------
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        convert_text(sys.argv[1], sys.argv[2])
+        print("Saved", sys.argv[2])
+    else:
+        # Round-trip the built-in map through a temporary file
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "haunted_house.map")
+            convert_list(original_grid, path)
+            grid, start, goal = load_map(path)
+            print("A* (Manhattan, mapped):", a_star(start, goal, grid, manhattan))
+            grid.close()
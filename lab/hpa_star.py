@@ -0,0 +1,268 @@
+import heapq
+import random
+from collections import deque
+
+from Haunted_house import (a_star, manhattan, neighbors, original_grid,
+                           parse_grid, reconstruct_path)
+
+
+# ---------- HPA* (hierarchical pathfinding) ----------
+# The grid is cut into cluster_size x cluster_size clusters. Entrances between
+# neighbouring clusters and the distances between entrances inside a cluster
+# are precomputed, so a query searches the small abstract graph first and
+# only refines the chosen corridor at full cell resolution.
+# Moving into a cell costs 1 unless it is a wall (same rule as a_star).
+# Paths are near-optimal; a_star stays the reference for exact costs.
+# The grid is used in place, not copied, and update_cell writes into it.
+# For very large maps pass a MappedGrid from grid_map.load_map(path,
+# writable=True) so the cells stay in the memory-mapped file.
+class HPAStar:
+    def __init__(self, grid, cluster_size=10, heuristic=manhattan):
+        self.grid = grid
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.size = cluster_size
+        self.heuristic = heuristic
+        self.entrances = {}   # border -> [(cell, cell across border), ...]
+        self.inter = {}       # node -> set of nodes across a border
+        self.intra = {}       # cluster -> {node: {node: distance}}
+
+        cluster_rows = (self.rows + self.size - 1) // self.size
+        cluster_cols = (self.cols + self.size - 1) // self.size
+        clusters = [(i, j) for i in range(cluster_rows) for j in range(cluster_cols)]
+        for cluster in clusters:
+            for border in self.borders(cluster):
+                if border[0] == cluster:
+                    self.build_entrances(border)
+        for cluster in clusters:
+            self.build_intra(cluster)
+
+    # --- Clusters and borders ---
+    def cluster_of(self, cell):
+        return (cell[0] // self.size, cell[1] // self.size)
+
+    def in_cluster(self, cell, cluster):
+        return self.cluster_of(cell) == cluster
+
+    def borders(self, cluster):
+        # Borders are stored as (upper/left cluster, lower/right cluster)
+        ci, cj = cluster
+        result = []
+        if ci > 0:
+            result.append(((ci - 1, cj), cluster))
+        if cj > 0:
+            result.append(((ci, cj - 1), cluster))
+        if (ci + 1) * self.size < self.rows:
+            result.append((cluster, (ci + 1, cj)))
+        if (cj + 1) * self.size < self.cols:
+            result.append((cluster, (ci, cj + 1)))
+        return result
+
+    def border_cells(self, border):
+        (ai, aj), (bi, bj) = border
+        if ai != bi:
+            x = bi * self.size
+            for y in range(aj * self.size, min((aj + 1) * self.size, self.cols)):
+                yield (x - 1, y), (x, y)
+        else:
+            y = bj * self.size
+            for x in range(ai * self.size, min((ai + 1) * self.size, self.rows)):
+                yield (x, y - 1), (x, y)
+
+    def build_entrances(self, border):
+        for a, b in self.entrances.get(border, []):
+            self.inter[a].discard(b)
+            self.inter[b].discard(a)
+
+        # Split the border into runs of cells that are free on both sides
+        transitions = []
+        run = []
+        for a, b in list(self.border_cells(border)) + [(None, None)]:
+            if a is not None and self.grid[a[0]][a[1]] == 0 and self.grid[b[0]][b[1]] == 0:
+                run.append((a, b))
+                continue
+            if run:
+                transitions += self.place_transitions(run)
+            run = []
+
+        self.entrances[border] = transitions
+        for a, b in transitions:
+            self.inter.setdefault(a, set()).add(b)
+            self.inter.setdefault(b, set()).add(a)
+
+    def place_transitions(self, run):
+        # Short runs get one transition in the middle, long ones one per end
+        if len(run) >= 6:
+            return [run[0], run[-1]]
+        return [run[len(run) // 2]]
+
+    def cluster_nodes(self, cluster):
+        nodes = set()
+        for border in self.borders(cluster):
+            for a, b in self.entrances.get(border, []):
+                nodes.add(a if self.in_cluster(a, cluster) else b)
+        return nodes
+
+    def build_intra(self, cluster):
+        nodes = self.cluster_nodes(cluster)
+        table = {}
+        for node in nodes:
+            dist, _ = self.search_in_cluster(node, cluster, nodes)
+            table[node] = {m: d for m, d in dist.items() if m in nodes and m != node}
+        self.intra[cluster] = table
+
+    def search_in_cluster(self, source, cluster, targets=None):
+        # BFS that never leaves the cluster; stops once all targets are found
+        dist = {source: 0}
+        came_from = {}
+        remaining = set(targets or ()) - {source}
+        queue = deque([source])
+        while queue and (targets is None or remaining):
+            current = queue.popleft()
+            for nx, ny in neighbors(current, self.rows, self.cols):
+                if (self.grid[nx][ny] == 1 or (nx, ny) in dist
+                        or not self.in_cluster((nx, ny), cluster)):
+                    continue
+                dist[(nx, ny)] = dist[current] + 1
+                came_from[(nx, ny)] = current
+                remaining.discard((nx, ny))
+                queue.append((nx, ny))
+        return dist, came_from
+
+    # --- Grid changes ---
+    def update_cell(self, cell, value):
+        self.update_cells([(cell, value)])
+
+    def update_cells(self, changes):
+        # Rebuild only the clusters (and borders) that the changed cells touch
+        dirty_borders = set()
+        dirty_clusters = set()
+        for (x, y), value in changes:
+            if self.grid[x][y] == value:
+                continue
+            self.grid[x][y] = value
+            cluster = self.cluster_of((x, y))
+            dirty_clusters.add(cluster)
+            for border in self.borders(cluster):
+                if any((x, y) in pair for pair in self.border_cells(border)):
+                    dirty_borders.add(border)
+        for border in dirty_borders:
+            self.build_entrances(border)
+            dirty_clusters.update(border)
+        for cluster in dirty_clusters:
+            self.build_intra(cluster)
+
+    # --- Queries ---
+    def find_path(self, start, goal):
+        if start == goal:
+            return [start]
+        if self.grid[start[0]][start[1]] == 1 or self.grid[goal[0]][goal[1]] == 1:
+            return None
+
+        # Temporarily connect start and goal to the nodes of their clusters
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        extra = {}
+        dist, _ = self.search_in_cluster(start, start_cluster,
+                                         self.cluster_nodes(start_cluster) | {goal})
+        for node in self.cluster_nodes(start_cluster) | {goal}:
+            if node in dist:
+                extra.setdefault(start, {})[node] = dist[node]
+        dist, _ = self.search_in_cluster(goal, goal_cluster, self.cluster_nodes(goal_cluster))
+        for node in self.cluster_nodes(goal_cluster):
+            if node in dist:
+                extra.setdefault(node, {})[goal] = dist[node]
+
+        abstract_path = self.abstract_search(start, goal, extra)
+        if abstract_path is None:
+            return None
+        return self.refine(abstract_path)
+
+    def abstract_edges(self, node, extra):
+        for other, d in self.intra[self.cluster_of(node)].get(node, {}).items():
+            yield other, d
+        for other in self.inter.get(node, ()):
+            yield other, 1
+        for other, d in extra.get(node, {}).items():
+            yield other, d
+
+    def abstract_search(self, start, goal, extra):
+        open_list = []
+        heapq.heappush(open_list, (self.heuristic(start, goal), 0, start))
+        came_from = {}
+        g_score = {start: 0}
+
+        while open_list:
+            _, cost, current = heapq.heappop(open_list)
+            if current == goal:
+                return reconstruct_path(came_from, start, goal)
+            if cost > g_score[current]:
+                continue
+
+            for node, d in self.abstract_edges(current, extra):
+                new_cost = g_score[current] + d
+                if node not in g_score or new_cost < g_score[node]:
+                    g_score[node] = new_cost
+                    came_from[node] = current
+                    priority = new_cost + self.heuristic(node, goal)
+                    heapq.heappush(open_list, (priority, new_cost, node))
+
+        return None
+
+    def refine(self, abstract_path):
+        path = [abstract_path[0]]
+        for u, v in zip(abstract_path, abstract_path[1:]):
+            cluster = self.cluster_of(u)
+            if cluster != self.cluster_of(v):
+                path.append(v)
+                continue
+            _, came_from = self.search_in_cluster(u, cluster, {v})
+            path += reconstruct_path(came_from, u, v)[1:]
+        return path
+
+
+# ---------- Check ----------
+def check_against_a_star(trials=60, steps=15, seed=0):
+    # Paths must be valid, reachability must match a_star, and the
+    # incrementally updated abstraction must equal a fresh rebuild
+    rng = random.Random(seed)
+    for _ in range(trials):
+        rows, cols = rng.randint(3, 40), rng.randint(3, 40)
+        grid = [[1 if rng.random() < 0.25 else 0 for _ in range(cols)] for _ in range(rows)]
+        size = rng.randint(2, 8)
+        planner = HPAStar(grid, size)
+        for _ in range(steps):
+            start = (rng.randrange(rows), rng.randrange(cols))
+            goal = (rng.randrange(rows), rng.randrange(cols))
+            path = planner.find_path(start, goal)
+            if grid[start[0]][start[1]] == 1 and start != goal:
+                assert path is None
+            else:
+                assert (path is None) == (a_star(start, goal, grid, manhattan) is None)
+            if path is not None:
+                assert path[0] == start and path[-1] == goal
+                for (ax, ay), (bx, by) in zip(path, path[1:]):
+                    assert abs(ax - bx) + abs(ay - by) == 1 and grid[bx][by] == 0
+
+            cell = (rng.randrange(rows), rng.randrange(cols))
+            planner.update_cell(cell, 1 - grid[cell[0]][cell[1]])
+            fresh = HPAStar(grid, size)
+            assert planner.entrances == fresh.entrances
+            assert planner.intra == fresh.intra
+            assert ({n: m for n, m in planner.inter.items() if m}
+                    == {n: m for n, m in fresh.inter.items() if m})
+    print("HPA* matches a_star reachability on %d random grids" % trials)
+
+
+# ---------- Main ----------
+if __name__ == "__main__":
+    grid, start, goal = parse_grid(original_grid)
+
+    planner = HPAStar(grid, cluster_size=3)
+    print("HPA*:", planner.find_path(start, goal))
+    print("A*  :", a_star(start, goal, grid, manhattan))
+
+    # Closing a door only rebuilds the clusters around it
+    planner.update_cell((2, 3), 1)
+    print("HPA* (door at (2, 3) closed):", planner.find_path(start, goal))
+
+    check_against_a_star()
@@ -15,15 +15,13 @@ def dfs(start, goal):
     while stack:
         node, path, cost = stack.pop()
         if node == goal:
-            print("Path:", path)
-            print("Total cost:", cost)
-            return
+            return path, cost
         if node not in visited:
             visited.add(node)
             for neigh, c in graph.get(node, []):
                 if neigh not in visited:
                     stack.append((neigh, path + [neigh], cost + c))
-    print("No path found.")
+    return None, None
 
 def bfs(start, goal):
     queue = deque([(start, [start], 0)])
@@ -31,15 +29,13 @@ def bfs(start, goal):
     while queue:
         node, path, cost = queue.popleft()
         if node == goal:
-            print("Path:", path)
-            print("Total cost:", cost)
-            return
+            return path, cost
         if node not in visited:
             visited.add(node)
             for neigh, c in graph.get(node, []):
                 if neigh not in visited:
                     queue.append((neigh, path + [neigh], cost + c))
-    print("No path found.")
+    return None, None
 
 def ucs(start, goal):
     pq = [(0, start, [start])]
@@ -47,25 +43,31 @@ def ucs(start, goal):
     while pq:
         cost, node, path = heapq.heappop(pq)
         if node == goal:
-            print("Path:", path)
-            print("Total cost:", cost)
-            return
+            return path, cost
         if node not in visited:
             visited.add(node)
             for neigh, c in graph.get(node, []):
                 if neigh not in visited:
                     heapq.heappush(pq, (cost + c, neigh, path + [neigh]))
-    print("No path found.")
+    return None, None
 
-start = input("Enter starting node: ").upper()
-goal = input("Enter target node: ").upper()
-algo = input("Choose algorithm (DFS / BFS / UCS): ").upper()
+def print_result(path, cost):
+    if path is None:
+        print("No path found.")
+    else:
+        print("Path:", path)
+        print("Total cost:", cost)
 
-if algo == "DFS":
-    dfs(start, goal)
-elif algo == "BFS":
-    bfs(start, goal)
-elif algo == "UCS":
-    ucs(start, goal)
-else:
-    print("Invalid algorithm choice!")
+if __name__ == "__main__":
+    start = input("Enter starting node: ").upper()
+    goal = input("Enter target node: ").upper()
+    algo = input("Choose algorithm (DFS / BFS / UCS): ").upper()
+
+    if algo == "DFS":
+        print_result(*dfs(start, goal))
+    elif algo == "BFS":
+        print_result(*bfs(start, goal))
+    elif algo == "UCS":
+        print_result(*ucs(start, goal))
+    else:
+        print("Invalid algorithm choice!")
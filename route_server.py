@@ -0,0 +1,249 @@
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from Assingment import algo
+from lab import rat
+
+# Graphs the server can answer queries on, and their search functions
+GRAPHS = {
+    "campus": algo,
+    "rat": rat,
+}
+ALGORITHMS = ("bfs", "dfs", "ucs")
+
+
+# ---------- Search (runs in the process pool) ----------
+def path_cost(graph, path):
+    cost = 0
+    for u, v in zip(path, path[1:]):
+        cost += dict(graph[u])[v]
+    return cost
+
+def run_search(graph_name, algorithm, start, goal):
+    module = GRAPHS[graph_name]
+    result = getattr(module, algorithm)(start, goal)
+    # algo.bfs/dfs return only the path, everything else returns (path, cost)
+    path = result[0] if isinstance(result, tuple) else result
+    if path is None:
+        return {"path": None, "cost": None}
+    return {"path": path, "cost": path_cost(module.graph, path)}
+
+
+class SearchError(Exception):
+    # A search failed in the pool (worker died or the search raised)
+    pass
+
+
+# ---------- LRU Result Cache ----------
+class LRUCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key not in self.items:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.items.move_to_end(key)
+        return self.items[key]
+
+    def put(self, key, value):
+        self.items[key] = value
+        self.items.move_to_end(key)
+        if len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+
+
+# ---------- Route Server ----------
+# Speaks newline-delimited JSON over TCP. A request looks like
+#   {"graph": "campus", "start": "AC1", "goal": "Cafe", "algorithm": "ucs"}
+# and {"stats": true} returns the cache counters (joins counts queries that
+# were merged into a search already running).
+class RouteServer:
+    def __init__(self, cache_size=128, workers=None):
+        self.cache = LRUCache(cache_size)
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.in_flight = {}
+        self.joins = 0
+        self.server = None
+        self.clients = {}
+
+    async def start(self, host="127.0.0.1", port=0):
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        self.server.close()
+        # Close client sockets first: this wakes handlers still waiting for a
+        # line, and wait_closed() waits for open connections since 3.12
+        for writer in self.clients.values():
+            writer.close()
+        await asyncio.gather(*self.clients, return_exceptions=True)
+        await self.server.wait_closed()
+        # shutdown() waits for the workers; keep that off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.pool.shutdown)
+
+    def stats(self):
+        return {"hits": self.cache.hits, "misses": self.cache.misses,
+                "joins": self.joins, "cached": len(self.cache.items)}
+
+    async def route(self, graph_name, algorithm, start, goal):
+        key = (graph_name, algorithm, start, goal)
+        # Identical queries that arrive while one is running share its result
+        if key in self.in_flight:
+            self.joins += 1
+            return await asyncio.shield(self.in_flight[key])
+
+        # A miss always starts exactly one search
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+        self.in_flight[key] = asyncio.ensure_future(self.compute(key))
+        return await asyncio.shield(self.in_flight[key])
+
+    async def compute(self, key):
+        pool = self.pool
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(pool, run_search, *key)
+        except BrokenProcessPool as e:
+            # A worker died and the pool stays unusable, so start a new one
+            # (unless another failed search already did)
+            if self.pool is pool:
+                pool.shutdown(wait=False)
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            raise SearchError() from e
+        except Exception as e:
+            raise SearchError() from e
+        finally:
+            del self.in_flight[key]
+        self.cache.put(key, result)
+        return result
+
+    async def handle_request(self, request):
+        if request.get("stats"):
+            return self.stats()
+        graph_name = request.get("graph", "campus")
+        algorithm = str(request.get("algorithm", "")).lower()
+        start, goal = request.get("start"), request.get("goal")
+        if graph_name not in GRAPHS:
+            return {"error": "Unknown graph: %s" % graph_name}
+        if algorithm not in ALGORITHMS:
+            return {"error": "Unknown algorithm: %s" % algorithm}
+        graph = GRAPHS[graph_name].graph
+        if start not in graph or goal not in graph:
+            return {"error": "Invalid location(s)."}
+        return await self.route(graph_name, algorithm, start, goal)
+
+    async def handle_client(self, reader, writer):
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.handle_request(json.loads(line))
+                except SearchError:
+                    response = {"error": "Search failed."}
+                except (ValueError, AttributeError, TypeError):
+                    response = {"error": "Invalid request."}
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self.clients[task]
+            writer.close()
+
+
+# ---------- In-process Client ----------
+async def request_route(host, port, request):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write((json.dumps(request) + "\n").encode())
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+async def check_server():
+    # Drives a server through the in-process client and checks coalescing,
+    # caching, LRU eviction, error responses and recovery from a dead worker
+    server = RouteServer(cache_size=2)
+    host, port = await server.start()
+    print("Route server listening on %s:%d" % (host, port))
+    try:
+        # Ten identical concurrent queries collapse into a single search
+        query = {"graph": "campus", "start": "Main Gate", "goal": "Sports Area", "algorithm": "ucs"}
+        results = await asyncio.gather(*[request_route(host, port, query) for _ in range(10)])
+        assert all(r == results[0] for r in results)
+        stats = server.stats()
+        assert stats["misses"] == 1 and stats["hits"] + stats["joins"] == 9
+        hits = stats["hits"]
+        print("UCS Result:", " -> ".join(results[0]["path"]), "(%s meters)" % results[0]["cost"])
+
+        # Repeated query is served from the cache
+        assert await request_route(host, port, query) == results[0]
+        assert server.cache.hits == hits + 1
+
+        # Two more queries push the first one out of the 2-entry cache
+        rat_query = {"graph": "rat", "start": "A", "goal": "E", "algorithm": "bfs"}
+        assert await request_route(host, port, rat_query) == {"path": ["A", "B", "E"], "cost": 5}
+        await request_route(host, port, dict(query, algorithm="bfs"))
+        await request_route(host, port, query)
+        stats = await request_route(host, port, {"stats": True})
+        assert stats["hits"] == hits + 1 and stats["misses"] == 4 and stats["cached"] == 2
+        print("Stats:", stats)
+
+        # Bad requests get error responses
+        errors = [
+            ({"start": "Nowhere", "goal": "AC1", "algorithm": "bfs"}, "Invalid location(s)."),
+            ({"start": "AC1", "goal": "Cafe", "algorithm": "astar"}, "Unknown algorithm: astar"),
+            ({"graph": "moon", "start": "A", "goal": "B", "algorithm": "bfs"}, "Unknown graph: moon"),
+            ([1, 2], "Invalid request."),
+            ({"start": ["AC1"], "goal": "Cafe", "algorithm": "bfs"}, "Invalid request."),
+        ]
+        for request, message in errors:
+            assert await request_route(host, port, request) == {"error": message}
+
+        # A search that raises in the pool is reported, not cached
+        try:
+            await server.route("campus", "astar", "AC1", "Cafe")
+            assert False, "expected SearchError"
+        except SearchError:
+            pass
+        assert ("campus", "astar", "AC1", "Cafe") not in server.cache.items
+
+        # Killing a worker breaks the pool: the next query gets an error
+        # reply and the one after it runs on a fresh pool
+        try:
+            await asyncio.wrap_future(server.pool.submit(os._exit, 1))
+        except BrokenProcessPool:
+            pass
+        lost_query = {"graph": "rat", "start": "A", "goal": "D", "algorithm": "ucs"}
+        assert await request_route(host, port, lost_query) == {"error": "Search failed."}
+        assert await request_route(host, port, lost_query) == {"path": ["A", "C", "D"], "cost": 5}
+
+        # An idle client must not keep close() from returning
+        _, idle = await asyncio.open_connection(host, port)
+        await asyncio.sleep(0.01)
+    finally:
+        await asyncio.wait_for(server.close(), timeout=5)
+    idle.close()
+    print("Route server checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(check_server())